@@ -1,31 +1,327 @@
 """Listmonk API client abstraction using httpx."""
 
 import asyncio
-from typing import Any
-from urllib.parse import urljoin
+import random
+import re
+import socket
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, Protocol
+from urllib.parse import urlparse
 
 import httpx
-from httpx import AsyncClient, Response
+import orjson
+from httpx import AsyncClient
 
 from .config import Config
+from .models import (
+    MAILING_LIST_ADAPTER,
+    TEMPLATE_LIST_ADAPTER,
+    CampaignListResponse,
+    MailingList,
+    SubscriberListResponse,
+    Template,
+)
 
 
 class ListmonkAPIError(Exception):
     """Base exception for Listmonk API errors."""
 
-    def __init__(self, message: str, status_code: int | None = None, response: dict[str, Any] | None = None):
+    __slots__ = ("status_code", "response", "retry_after")
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        response: dict[str, Any] | None = None,
+        retry_after: float | None = None
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.response = response
+        self.retry_after = retry_after
+
+
+class UnauthorizedError(ListmonkAPIError):
+    """Raised for HTTP 401/403 responses."""
+
+    __slots__ = ()
+
+
+class NotFoundError(ListmonkAPIError):
+    """Raised for HTTP 404 responses."""
+
+    __slots__ = ()
+
+
+class ConflictError(ListmonkAPIError):
+    """Raised for HTTP 409 responses."""
+
+    __slots__ = ()
+
+
+class RateLimitedError(ListmonkAPIError):
+    """Raised for HTTP 429 responses."""
+
+    __slots__ = ()
+
+
+class ServerError(ListmonkAPIError):
+    """Raised for HTTP 5xx responses."""
+
+    __slots__ = ()
+
+
+# Static status -> exception class map, so error raising is one dict lookup
+# and callers can catch e.g. NotFoundError instead of inspecting status_code.
+_STATUS_MAP: dict[int, type[ListmonkAPIError]] = {
+    401: UnauthorizedError,
+    403: UnauthorizedError,
+    404: NotFoundError,
+    409: ConflictError,
+    429: RateLimitedError,
+    500: ServerError,
+    502: ServerError,
+    503: ServerError,
+    504: ServerError,
+}
+
+
+class TransportError(Exception):
+    """Raised by a transport when the HTTP request itself fails (connection,
+    timeout, protocol errors) — i.e. before any HTTP status is available."""
+
+
+class _Transport(Protocol):
+    """Minimal interface a ListmonkClient HTTP backend must implement."""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None
+    ) -> tuple[int, bytes, dict[str, str]]:
+        """Perform a request, returning (status_code, body bytes, headers)."""
+        ...
+
+    async def close(self) -> None:
+        """Release the underlying connection pool."""
+        ...
+
+
+_LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+
+class HttpxTransport:
+    """Default transport backed by a pooled httpx.AsyncClient."""
+
+    def __init__(self, config: Config, headers: dict[str, str]):
+        limits = httpx.Limits(
+            max_keepalive_connections=50,
+            max_connections=100,
+            keepalive_expiry=60
+        )
+
+        transport: httpx.AsyncHTTPTransport | None = None
+        if config.uds:
+            # Co-located Listmonk reachable over a unix domain socket:
+            # skips the TCP/TLS stack entirely
+            transport = httpx.AsyncHTTPTransport(uds=config.uds, limits=limits, http2=True)
+        elif urlparse(config.url).hostname in _LOOPBACK_HOSTS:
+            # Loopback deployment: disable Nagle so small JSON requests
+            # aren't held back waiting to coalesce
+            transport = httpx.AsyncHTTPTransport(
+                limits=limits,
+                http2=True,
+                socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+            )
+
+        self._client = AsyncClient(
+            # Multiplex concurrent tool calls over one HTTP/2 connection
+            # when the server supports it (falls back to HTTP/1.1 otherwise)
+            http2=True,
+            timeout=httpx.Timeout(config.timeout),
+            limits=limits,
+            transport=transport,
+            headers=headers
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None
+    ) -> tuple[int, bytes, dict[str, str]]:
+        """Perform a request via httpx."""
+        try:
+            response = await self._client.request(
+                method=method,
+                url=url,
+                params=params,
+                content=content,
+                headers=headers
+            )
+        except httpx.RequestError as e:
+            raise TransportError(str(e)) from e
+
+        return response.status_code, response.content, dict(response.headers)
+
+    async def close(self) -> None:
+        """Close the httpx client."""
+        await self._client.aclose()
+
+
+class AiohttpTransport:
+    """Optional transport backed by aiohttp.ClientSession, which sustains
+    noticeably higher throughput than httpx under concurrent load.
+
+    Requires the ``aiohttp`` package; select it with
+    LISTMONK_MCP_HTTP_BACKEND=aiohttp.
+    """
+
+    def __init__(self, config: Config, headers: dict[str, str]):
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise RuntimeError(
+                "The aiohttp HTTP backend requires the 'aiohttp' package "
+                "(pip install listmonk-mcp[aiohttp])"
+            ) from e
+
+        self._aiohttp = aiohttp
+        if config.uds:
+            connector: aiohttp.BaseConnector = aiohttp.UnixConnector(path=config.uds)
+        else:
+            connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=60)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=config.timeout),
+            headers=headers
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None
+    ) -> tuple[int, bytes, dict[str, str]]:
+        """Perform a request via aiohttp."""
+        # aiohttp only accepts string query values
+        str_params = {k: str(v) for k, v in params.items()} if params else None
+
+        try:
+            async with self._session.request(
+                method, url, params=str_params, data=content, headers=headers
+            ) as response:
+                body = await response.read()
+                resp_headers = {k.lower(): v for k, v in response.headers.items()}
+                return response.status, body, resp_headers
+        except self._aiohttp.ClientError as e:
+            raise TransportError(str(e)) from e
+
+    async def close(self) -> None:
+        """Close the aiohttp session."""
+        await self._session.close()
+
+
+_TRANSPORTS: dict[str, type[HttpxTransport] | type[AiohttpTransport]] = {
+    "httpx": HttpxTransport,
+    "aiohttp": AiohttpTransport,
+}
+
+# HTTP statuses worth retrying: rate limiting and transient server errors.
+# Other 4xx responses are caller errors and fail immediately.
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound on any single backoff sleep, in seconds.
+_MAX_BACKOFF = 30.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Capped exponential backoff with jitter to avoid retry stampedes."""
+    return min(_MAX_BACKOFF, 2.0 ** attempt * (1 + random.random() * 0.5))
+
+
+# Debounce window and batch cap for coalesced email lookups.
+_EMAIL_BATCH_WINDOW = 0.005
+_EMAIL_BATCH_MAX = 50
+
+# Sanity check applied before an email ever reaches a query filter.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# TTL and size cap for cached email lookups (misses are cached too).
+_EMAIL_CACHE_TTL = 15.0
+_EMAIL_CACHE_MAX = 4096
+
+
+def _pack(**fields: Any) -> dict[str, Any]:
+    """Build a request payload from the given fields, dropping Nones.
+
+    A single C-level dict comprehension replaces the per-method ladder of
+    ``if x is not None`` branches; None stays the "not provided" sentinel
+    used by the update methods' signatures.
+    """
+    return {k: v for k, v in fields.items() if v is not None}
+
+
+def _escape_query_value(value: str) -> str:
+    """Escape a string literal for use in a Listmonk SQL query filter."""
+    return value.replace("'", "''")
+
+
+# TTL and size cap for the mostly-static read cache (lists, templates).
+_READ_CACHE_TTL = 30.0
+_READ_CACHE_MAX = 256
+
+# Fixed endpoint paths and prefixes, so building a per-request path is a
+# single concatenation instead of f-string formatting plus joining.
+_EP_HEALTH = "/api/health"
+_EP_SUBSCRIBERS = "/api/subscribers"
+_EP_SUBSCRIBER = "/api/subscribers/"
+_EP_LISTS = "/api/lists"
+_EP_LIST = "/api/lists/"
+_EP_CAMPAIGNS = "/api/campaigns"
+_EP_CAMPAIGN = "/api/campaigns/"
+_EP_TEMPLATES = "/api/templates"
+_EP_TEMPLATE = "/api/templates/"
+_EP_TX = "/api/tx"
 
 
 class ListmonkClient:
     """Async HTTP client for Listmonk API operations."""
 
+    __slots__ = (
+        "config",
+        "base_url",
+        "_base_url_with_slash",
+        "_auth",
+        "_transport",
+        "_email_lookup_queue",
+        "_email_lookup_task",
+        "_read_cache",
+        "_email_cache",
+    )
+
     def __init__(self, config: Config):
         self.config = config
         self.base_url = config.url.rstrip('/')
-        self._client: AsyncClient | None = None
+        # Precomputed so _build_url is a single concatenation per request
+        self._base_url_with_slash = self.base_url + "/"
+        # API token authentication format: "username:token"
+        self._auth = f"token {config.username}:{config.password}"
+        self._transport: _Transport | None = None
+        self._email_lookup_queue: asyncio.Queue[tuple[str, asyncio.Future[dict[str, Any]]]] = asyncio.Queue()
+        self._email_lookup_task: asyncio.Task[None] | None = None
+        # endpoint -> (expiry monotonic time, cached body, etag)
+        self._read_cache: dict[str, tuple[float, dict[str, Any], str | None]] = {}
+        # lowercased email -> (expiry monotonic time, subscriber or None for a miss)
+        self._email_cache: dict[str, tuple[float, dict[str, Any] | None]] = {}
 
     async def __aenter__(self) -> "ListmonkClient":
         """Async context manager entry."""
@@ -36,92 +332,261 @@ class ListmonkClient:
         """Async context manager exit."""
         await self.close()
 
-    async def connect(self) -> None:
-        """Initialize the HTTP client with authentication."""
-        # Use API token authentication format: "username:token"
-        auth_token = f"{self.config.username}:{self.config.password}"
+    async def connect(self, verify: bool = False) -> None:
+        """Initialize the HTTP client with authentication.
+
+        Args:
+            verify: When True, probe /api/health before returning. Off by
+                default so connecting doesn't cost a round trip; the first
+                real request surfaces connectivity/auth errors anyway.
+        """
+        transport_cls = _TRANSPORTS.get(self.config.http_backend)
+        if transport_cls is None:
+            raise ValueError(
+                f"Unknown HTTP backend '{self.config.http_backend}'. "
+                f"Valid backends: {sorted(_TRANSPORTS)}"
+            )
 
-        self._client = AsyncClient(
-            timeout=httpx.Timeout(self.config.timeout),
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+        self._transport = transport_cls(
+            self.config,
             headers={
                 "User-Agent": "Listmonk-MCP-Server/0.1.0",
                 "Accept": "application/json",
-                "Content-Type": "application/json",
-                "Authorization": f"token {auth_token}"
+                "Content-Type": "application/json"
             }
         )
 
-        # Test connection with health check
-        await self.health_check()
+        # Optionally test the connection with a health check
+        if verify:
+            await self.health_check()
+
+    def update_credentials(self, username: str, password: str) -> None:
+        """Swap the API credentials without dropping pooled connections.
+
+        Authorization rides on each request rather than the session, so a
+        token rotation takes effect immediately while keep-alive connections
+        stay warm.
+        """
+        self._auth = f"token {username}:{password}"
 
     async def close(self) -> None:
         """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
-
-    def _get_client(self) -> AsyncClient:
-        """Get the HTTP client, raising error if not connected."""
-        if self._client is None:
+        if self._email_lookup_task and not self._email_lookup_task.done():
+            self._email_lookup_task.cancel()
+            try:
+                # Wait for cancellation so the in-flight batch fails its
+                # futures before the transport goes away
+                await self._email_lookup_task
+            except asyncio.CancelledError:
+                pass
+            self._email_lookup_task = None
+        # Fail any lookups still queued so no caller is left awaiting
+        while not self._email_lookup_queue.empty():
+            email, future = self._email_lookup_queue.get_nowait()
+            if not future.done():
+                future.set_exception(
+                    ListmonkAPIError(f"Client closed during email lookup for {email}")
+                )
+        if self._transport:
+            await self._transport.close()
+            self._transport = None
+
+    def _get_transport(self) -> _Transport:
+        """Get the HTTP transport, raising error if not connected."""
+        if self._transport is None:
             raise RuntimeError("Client not connected. Call connect() first or use as async context manager.")
-        return self._client
+        return self._transport
 
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint."""
-        return urljoin(f"{self.base_url}/", endpoint.lstrip('/'))
+        # Endpoints are always relative API paths, so plain concatenation
+        # replaces the slower general-purpose urljoin.
+        return self._base_url_with_slash + endpoint.lstrip('/')
 
-    async def _request(
+    async def _send(
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
         retry_count: int = 0
-    ) -> dict[str, Any]:
-        """Make HTTP request with retry logic and error handling."""
-        client = self._get_client()
+    ) -> tuple[int, bytes, dict[str, str]]:
+        """Issue the HTTP call with transport-level retries, returning the raw response."""
+        transport = self._get_transport()
         url = self._build_url(endpoint)
 
+        # Pre-serialize request bodies with orjson instead of letting the
+        # backend run them through stdlib json (Content-Type is set globally).
+        content = orjson.dumps(json_data) if json_data is not None else None
+
+        # Auth is attached per request (not to the pooled session) so that
+        # update_credentials can rotate tokens without connection churn
+        request_headers = {"Authorization": self._auth}
+        if headers:
+            request_headers.update(headers)
+
         try:
-            response = await client.request(
+            return await transport.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json_data
+                content=content,
+                headers=request_headers
             )
+        except TransportError as e:
+            if retry_count < self.config.max_retries:
+                await asyncio.sleep(_backoff_delay(retry_count))
+                return await self._send(method, endpoint, params, json_data, headers, retry_count + 1)
 
-            return await self._handle_response(response)
+            raise ListmonkAPIError(f"Request failed: {str(e)}") from e
 
-        except httpx.RequestError as e:
-            if retry_count < self.config.max_retries:
-                await asyncio.sleep(2 ** retry_count)  # Exponential backoff
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        retry_count: int = 0
+    ) -> dict[str, Any]:
+        """Make HTTP request with retry logic and error handling."""
+        try:
+            status_code, body, headers = await self._send(method, endpoint, params, json_data)
+            return self._handle_response(status_code, body, headers)
+
+        except ListmonkAPIError as e:
+            if e.status_code in _RETRYABLE_STATUS_CODES and retry_count < self.config.max_retries:
+                # Honor the server's Retry-After when provided
+                delay = e.retry_after if e.retry_after is not None else _backoff_delay(retry_count)
+                await asyncio.sleep(min(delay, _MAX_BACKOFF))
                 return await self._request(method, endpoint, params, json_data, retry_count + 1)
 
-            raise ListmonkAPIError(f"Request failed: {str(e)}") from e
+            raise
 
-    async def _handle_response(self, response: Response) -> dict[str, Any]:
+    def _handle_response(
+        self,
+        status_code: int,
+        body: bytes,
+        headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
         """Handle HTTP response and extract data."""
         try:
-            response_data = response.json()
-        except Exception:
-            response_data = {"text": response.text}
+            # orjson parses the raw bytes directly, skipping both the
+            # charset decode step and the slower stdlib json parser.
+            response_data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            response_data = {"text": body.decode("utf-8", errors="replace")}
 
-        if response.is_success:
+        if 200 <= status_code < 300:
             return response_data  # type: ignore[no-any-return]
 
         # Handle API errors
-        error_message = response_data.get("message", f"HTTP {response.status_code}")
-        raise ListmonkAPIError(
+        retry_after: float | None = None
+        if headers:
+            try:
+                retry_after = float(headers.get("retry-after", ""))
+            except ValueError:
+                retry_after = None
+
+        # `or` keeps the f-string fallback unevaluated when a message exists
+        error_message = response_data.get("message") or f"HTTP {status_code}"
+        error_cls = _STATUS_MAP.get(status_code, ListmonkAPIError)
+        raise error_cls(
             message=error_message,
-            status_code=response.status_code,
-            response=response_data
+            status_code=status_code,
+            response=response_data,
+            retry_after=retry_after
         )
 
+    async def _cached_get(self, endpoint: str, retry_count: int = 0) -> dict[str, Any]:
+        """GET with a short TTL cache and ETag revalidation.
+
+        Used for mostly-static reads (lists, templates) that chatty sessions
+        re-request on nearly every tool call. Fresh entries skip the HTTP
+        round trip entirely; expired entries with a stored ETag are
+        revalidated with If-None-Match so a 304 reuses the cached body.
+        Misses retry on 429/5xx with the same backoff as ``_request``.
+        """
+        now = time.monotonic()
+        entry = self._read_cache.get(endpoint)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+
+        headers = {"If-None-Match": entry[2]} if entry is not None and entry[2] else None
+
+        status_code, body, resp_headers = await self._send("GET", endpoint, headers=headers)
+
+        if status_code == 304 and entry is not None:
+            # Not modified: extend the TTL and reuse the cached body
+            self._read_cache[endpoint] = (now + _READ_CACHE_TTL, entry[1], entry[2])
+            return entry[1]
+
+        try:
+            data = self._handle_response(status_code, body, resp_headers)
+        except ListmonkAPIError as e:
+            if e.status_code in _RETRYABLE_STATUS_CODES and retry_count < self.config.max_retries:
+                delay = e.retry_after if e.retry_after is not None else _backoff_delay(retry_count)
+                await asyncio.sleep(min(delay, _MAX_BACKOFF))
+                return await self._cached_get(endpoint, retry_count + 1)
+
+            raise
+
+        if len(self._read_cache) >= _READ_CACHE_MAX:
+            self._read_cache.clear()
+        self._read_cache[endpoint] = (now + _READ_CACHE_TTL, data, resp_headers.get("etag"))
+        return data
+
+    def _invalidate_read_cache(self, *endpoints: str) -> None:
+        """Drop cached entries for endpoints whose data just changed."""
+        for endpoint in endpoints:
+            self._read_cache.pop(endpoint, None)
+
+    async def _iter_paginated(
+        self,
+        fetch_page: Callable[[int], Awaitable[dict[str, Any]]],
+        per_page: int,
+        prefetch: int
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield rows from a paginated endpoint, prefetching pages ahead.
+
+        A background producer keeps up to ``prefetch`` pages in flight so
+        the HTTP round trip for page K+1 overlaps the caller's processing
+        of page K. Iteration stops when a page comes back short.
+        """
+        queue: asyncio.Queue[list[dict[str, Any]] | Exception | None] = asyncio.Queue(maxsize=prefetch)
+
+        async def _producer() -> None:
+            page = 1
+            try:
+                while True:
+                    response = await fetch_page(page)
+                    results = response.get("data", {}).get("results", [])
+                    await queue.put(results)
+                    if len(results) < per_page:
+                        break
+                    page += 1
+            except Exception as e:  # propagated to the consumer
+                await queue.put(e)
+            finally:
+                await queue.put(None)
+
+        producer = asyncio.create_task(_producer())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                for row in item:
+                    yield row
+        finally:
+            producer.cancel()
+
     # Health and Authentication
     async def health_check(self) -> dict[str, Any]:
         """Check if Listmonk server is healthy and accessible."""
-        return await self._request("GET", "/api/health")
+        return await self._request("GET", _EP_HEALTH)
 
     # Subscriber Operations
     async def get_subscribers(
@@ -142,21 +607,123 @@ class ListmonkClient:
         if query:
             params["query"] = query
 
-        return await self._request("GET", "/api/subscribers", params=params)
+        return await self._request("GET", _EP_SUBSCRIBERS, params=params)
+
+    async def get_subscribers_typed(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        order_by: str = "created_at",
+        order: str = "desc",
+        query: str | None = None
+    ) -> SubscriberListResponse:
+        """Get a page of subscribers as typed models.
+
+        The rows come from Listmonk itself, so they are constructed without
+        re-validation via SubscriberListResponse.from_api.
+        """
+        response = await self.get_subscribers(page, per_page, order_by, order, query)
+        return SubscriberListResponse.from_api(response.get("data", {}))
+
+    def iter_subscribers(
+        self,
+        per_page: int = 100,
+        query: str | None = None,
+        prefetch: int = 2
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all subscribers, prefetching pages ahead of the consumer."""
+        async def fetch(page: int) -> dict[str, Any]:
+            return await self.get_subscribers(page=page, per_page=per_page, query=query)
+
+        return self._iter_paginated(fetch, per_page, prefetch)
 
     async def get_subscriber(self, subscriber_id: int) -> dict[str, Any]:
         """Get subscriber by ID."""
-        return await self._request("GET", f"/api/subscribers/{subscriber_id}")
+        return await self._request("GET", _EP_SUBSCRIBER + str(subscriber_id))
 
     async def get_subscriber_by_email(self, email: str) -> dict[str, Any]:
-        """Get subscriber by email address."""
-        params = {"query": f"subscribers.email = '{email}'"}
-        response = await self._request("GET", "/api/subscribers", params=params)
+        """Get subscriber by email address.
+
+        Concurrent lookups within a short debounce window are coalesced into
+        a single ``subscribers.email IN (...)`` request and demultiplexed back
+        to each caller, so N simultaneous resolutions cost one round trip.
+        Results — including "not found" — are cached briefly, so repeated
+        resolutions of the same address within a session skip the server.
+        """
+        if not _EMAIL_RE.match(email):
+            raise ListmonkAPIError(f"Invalid email address: {email}", status_code=400)
+
+        cached = self._email_cache.get(email.lower())
+        if cached is not None and time.monotonic() < cached[0]:
+            if cached[1] is None:
+                raise NotFoundError(f"Subscriber with email {email} not found", status_code=404)
+            return {"data": cached[1]}
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._email_lookup_queue.put_nowait((email, future))
+
+        if self._email_lookup_task is None or self._email_lookup_task.done():
+            self._email_lookup_task = asyncio.create_task(self._drain_email_lookups())
+
+        return await future
+
+    async def _drain_email_lookups(self) -> None:
+        """Serve queued email lookups in batches until the queue is empty."""
+        queue = self._email_lookup_queue
+        while not queue.empty():
+            # Debounce so concurrent callers land in the same batch
+            await asyncio.sleep(_EMAIL_BATCH_WINDOW)
+
+            batch: list[tuple[str, asyncio.Future[dict[str, Any]]]] = []
+            while not queue.empty() and len(batch) < _EMAIL_BATCH_MAX:
+                batch.append(queue.get_nowait())
+
+            if batch:
+                await self._lookup_email_batch(batch)
+
+    async def _lookup_email_batch(self, batch: list[tuple[str, asyncio.Future[dict[str, Any]]]]) -> None:
+        """Resolve a batch of email lookups with one IN-query request."""
+        emails = ", ".join(f"'{_escape_query_value(email)}'" for email, _ in batch)
+        params: dict[str, Any] = {
+            "query": f"subscribers.email IN ({emails})",
+            "per_page": len(batch),
+        }
 
-        if response.get("data", {}).get("results"):
-            return {"data": response["data"]["results"][0]}
-        else:
-            raise ListmonkAPIError(f"Subscriber with email {email} not found", status_code=404)
+        try:
+            try:
+                response = await self._request("GET", _EP_SUBSCRIBERS, params=params)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            results = response.get("data", {}).get("results", [])
+            by_email = {sub.get("email", "").lower(): sub for sub in results}
+
+            if len(self._email_cache) >= _EMAIL_CACHE_MAX:
+                self._email_cache.clear()
+            expires = time.monotonic() + _EMAIL_CACHE_TTL
+
+            for email, future in batch:
+                subscriber = by_email.get(email.lower())
+                self._email_cache[email.lower()] = (expires, subscriber)
+                if future.done():
+                    continue
+                if subscriber is not None:
+                    future.set_result({"data": subscriber})
+                else:
+                    future.set_exception(
+                        NotFoundError(f"Subscriber with email {email} not found", status_code=404)
+                    )
+        finally:
+            # Cancellation mid-request (e.g. close() cancelling the drain
+            # task) must not leave any caller awaiting a pending future
+            for email, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        ListmonkAPIError(f"Email lookup aborted for {email}")
+                    )
 
     async def create_subscriber(
         self,
@@ -176,7 +743,8 @@ class ListmonkClient:
             "attribs": attribs or {},
             "preconfirm_subscriptions": preconfirm_subscriptions
         }
-        return await self._request("POST", "/api/subscribers", json_data=data)
+        self._email_cache.pop(email.lower(), None)
+        return await self._request("POST", _EP_SUBSCRIBERS, json_data=data)
 
     async def update_subscriber(
         self,
@@ -188,37 +756,82 @@ class ListmonkClient:
         attribs: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Update an existing subscriber."""
-        data: dict[str, Any] = {}
-        if email is not None:
-            data["email"] = email
-        if name is not None:
-            data["name"] = name
-        if status is not None:
-            data["status"] = status
-        if lists is not None:
-            data["lists"] = lists
-        if attribs is not None:
-            data["attribs"] = attribs
-
-        return await self._request("PUT", f"/api/subscribers/{subscriber_id}", json_data=data)
+        data = _pack(email=email, name=name, status=status, lists=lists, attribs=attribs)
+
+        # The subscriber's previous email isn't known here, so drop the lot
+        self._email_cache.clear()
+        return await self._request("PUT", _EP_SUBSCRIBER + str(subscriber_id), json_data=data)
 
     async def delete_subscriber(self, subscriber_id: int) -> dict[str, Any]:
         """Delete a subscriber."""
-        return await self._request("DELETE", f"/api/subscribers/{subscriber_id}")
+        self._email_cache.clear()
+        return await self._request("DELETE", _EP_SUBSCRIBER + str(subscriber_id))
 
     async def set_subscriber_status(self, subscriber_id: int, status: str) -> dict[str, Any]:
         """Set subscriber status (enabled, disabled, blocklisted)."""
+        self._email_cache.clear()
         data = {"status": status}
-        return await self._request("PUT", f"/api/subscribers/{subscriber_id}", json_data=data)
+        return await self._request("PUT", _EP_SUBSCRIBER + str(subscriber_id), json_data=data)
+
+    @staticmethod
+    async def _bounded(
+        sem: asyncio.Semaphore,
+        func: Callable[..., Awaitable[dict[str, Any]]],
+        *args: Any
+    ) -> dict[str, Any]:
+        """Run one coroutine under the shared concurrency semaphore."""
+        async with sem:
+            return await func(*args)
+
+    async def bulk_delete_subscribers(
+        self,
+        subscriber_ids: list[int],
+        concurrency: int = 10
+    ) -> list[dict[str, Any] | BaseException]:
+        """Delete many subscribers with bounded concurrency.
+
+        Dispatches up to ``concurrency`` deletes at a time over the shared
+        connection pool instead of awaiting them one by one. Returns one
+        result (or exception) per ID, in input order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(
+            *(self._bounded(sem, self.delete_subscriber, subscriber_id) for subscriber_id in subscriber_ids),
+            return_exceptions=True
+        )
+
+    async def bulk_update_subscriber_status(
+        self,
+        subscriber_ids: list[int],
+        status: str,
+        concurrency: int = 10
+    ) -> list[dict[str, Any] | BaseException]:
+        """Set the status of many subscribers with bounded concurrency.
+
+        Same dispatch pattern as bulk_delete_subscribers; returns one result
+        (or exception) per ID, in input order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(
+            *(self._bounded(sem, self.set_subscriber_status, subscriber_id, status) for subscriber_id in subscriber_ids),
+            return_exceptions=True
+        )
 
     # List Operations
     async def get_lists(self) -> dict[str, Any]:
         """Get all mailing lists."""
-        return await self._request("GET", "/api/lists")
+        return await self._cached_get(_EP_LISTS)
+
+    async def get_lists_typed(self) -> list[MailingList]:
+        """Get all mailing lists as validated models."""
+        response = await self.get_lists()
+        data = response.get("data", {})
+        results = data.get("results", []) if isinstance(data, dict) else data
+        return MAILING_LIST_ADAPTER.validate_python(results)
 
     async def get_list(self, list_id: int) -> dict[str, Any]:
         """Get mailing list by ID."""
-        return await self._request("GET", f"/api/lists/{list_id}")
+        return await self._cached_get(_EP_LIST + str(list_id))
 
     async def create_list(
         self,
@@ -238,7 +851,8 @@ class ListmonkClient:
         if description:
             data["description"] = description
 
-        return await self._request("POST", "/api/lists", json_data=data)
+        self._invalidate_read_cache(_EP_LISTS)
+        return await self._request("POST", _EP_LISTS, json_data=data)
 
     async def update_list(
         self,
@@ -250,28 +864,32 @@ class ListmonkClient:
         description: str | None = None
     ) -> dict[str, Any]:
         """Update an existing mailing list."""
-        data: dict[str, Any] = {}
-        if name is not None:
-            data["name"] = name
-        if type is not None:
-            data["type"] = type
-        if optin is not None:
-            data["optin"] = optin
-        if tags is not None:
-            data["tags"] = tags
-        if description is not None:
-            data["description"] = description
+        data = _pack(name=name, type=type, optin=optin, tags=tags, description=description)
 
-        return await self._request("PUT", f"/api/lists/{list_id}", json_data=data)
+        self._invalidate_read_cache(_EP_LISTS, _EP_LIST + str(list_id))
+        return await self._request("PUT", _EP_LIST + str(list_id), json_data=data)
 
     async def delete_list(self, list_id: int) -> dict[str, Any]:
         """Delete a mailing list."""
-        return await self._request("DELETE", f"/api/lists/{list_id}")
+        self._invalidate_read_cache(_EP_LISTS, _EP_LIST + str(list_id))
+        return await self._request("DELETE", _EP_LIST + str(list_id))
 
     async def get_list_subscribers(self, list_id: int, page: int = 1, per_page: int = 20) -> dict[str, Any]:
         """Get subscribers for a specific list."""
         params = {"page": page, "per_page": per_page}
-        return await self._request("GET", f"/api/lists/{list_id}/subscribers", params=params)
+        return await self._request("GET", _EP_LIST + str(list_id) + "/subscribers", params=params)
+
+    def iter_list_subscribers(
+        self,
+        list_id: int,
+        per_page: int = 100,
+        prefetch: int = 2
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over a list's subscribers, prefetching pages ahead of the consumer."""
+        async def fetch(page: int) -> dict[str, Any]:
+            return await self.get_list_subscribers(list_id, page=page, per_page=per_page)
+
+        return self._iter_paginated(fetch, per_page, prefetch)
 
     # Campaign Operations
     async def get_campaigns(
@@ -285,11 +903,34 @@ class ListmonkClient:
         if status:
             params["status"] = status
 
-        return await self._request("GET", "/api/campaigns", params=params)
+        return await self._request("GET", _EP_CAMPAIGNS, params=params)
+
+    async def get_campaigns_typed(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        status: str | None = None
+    ) -> CampaignListResponse:
+        """Get a page of campaigns as typed models, constructed without
+        re-validation via CampaignListResponse.from_api."""
+        response = await self.get_campaigns(page, per_page, status)
+        return CampaignListResponse.from_api(response.get("data", {}))
+
+    def iter_campaigns(
+        self,
+        per_page: int = 100,
+        status: str | None = None,
+        prefetch: int = 2
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all campaigns, prefetching pages ahead of the consumer."""
+        async def fetch(page: int) -> dict[str, Any]:
+            return await self.get_campaigns(page=page, per_page=per_page, status=status)
+
+        return self._iter_paginated(fetch, per_page, prefetch)
 
     async def get_campaign(self, campaign_id: int) -> dict[str, Any]:
         """Get campaign by ID."""
-        return await self._request("GET", f"/api/campaigns/{campaign_id}")
+        return await self._request("GET", _EP_CAMPAIGN + str(campaign_id))
 
     async def create_campaign(
         self,
@@ -317,7 +958,7 @@ class ListmonkClient:
         if template_id:
             data["template_id"] = template_id
 
-        return await self._request("POST", "/api/campaigns", json_data=data)
+        return await self._request("POST", _EP_CAMPAIGNS, json_data=data)
 
     async def update_campaign(
         self,
@@ -329,41 +970,38 @@ class ListmonkClient:
         tags: list[str] | None = None
     ) -> dict[str, Any]:
         """Update an existing campaign."""
-        data: dict[str, Any] = {}
-        if name is not None:
-            data["name"] = name
-        if subject is not None:
-            data["subject"] = subject
-        if lists is not None:
-            data["lists"] = lists
-        if body is not None:
-            data["body"] = body
-        if tags is not None:
-            data["tags"] = tags
+        data = _pack(name=name, subject=subject, lists=lists, body=body, tags=tags)
 
-        return await self._request("PUT", f"/api/campaigns/{campaign_id}", json_data=data)
+        return await self._request("PUT", _EP_CAMPAIGN + str(campaign_id), json_data=data)
 
     async def send_campaign(self, campaign_id: int) -> dict[str, Any]:
         """Send a campaign immediately."""
-        return await self._request("PUT", f"/api/campaigns/{campaign_id}/status", json_data={"status": "running"})
+        return await self._request("PUT", _EP_CAMPAIGN + str(campaign_id) + "/status", json_data={"status": "running"})
 
     async def schedule_campaign(self, campaign_id: int, send_at: str) -> dict[str, Any]:
         """Schedule a campaign for future delivery."""
         data = {"status": "scheduled", "send_at": send_at}
-        return await self._request("PUT", f"/api/campaigns/{campaign_id}/status", json_data=data)
+        return await self._request("PUT", _EP_CAMPAIGN + str(campaign_id) + "/status", json_data=data)
 
     async def get_campaign_preview(self, campaign_id: int) -> dict[str, Any]:
         """Get campaign HTML preview."""
-        return await self._request("GET", f"/api/campaigns/{campaign_id}/preview")
+        return await self._request("GET", _EP_CAMPAIGN + str(campaign_id) + "/preview")
 
     # Template Operations
     async def get_templates(self) -> dict[str, Any]:
         """Get all email templates."""
-        return await self._request("GET", "/api/templates")
+        return await self._cached_get(_EP_TEMPLATES)
+
+    async def get_templates_typed(self) -> list[Template]:
+        """Get all email templates as validated models."""
+        response = await self.get_templates()
+        data = response.get("data", {})
+        results = data.get("results", []) if isinstance(data, dict) else data
+        return TEMPLATE_LIST_ADAPTER.validate_python(results)
 
     async def get_template(self, template_id: int) -> dict[str, Any]:
         """Get template by ID."""
-        return await self._request("GET", f"/api/templates/{template_id}")
+        return await self._cached_get(_EP_TEMPLATE + str(template_id))
 
     async def create_template(
         self,
@@ -379,7 +1017,8 @@ class ListmonkClient:
             "type": type,
             "is_default": is_default
         }
-        return await self._request("POST", "/api/templates", json_data=data)
+        self._invalidate_read_cache(_EP_TEMPLATES)
+        return await self._request("POST", _EP_TEMPLATES, json_data=data)
 
     async def update_template(
         self,
@@ -389,19 +1028,15 @@ class ListmonkClient:
         is_default: bool | None = None
     ) -> dict[str, Any]:
         """Update an existing template."""
-        data: dict[str, Any] = {}
-        if name is not None:
-            data["name"] = name
-        if body is not None:
-            data["body"] = body
-        if is_default is not None:
-            data["is_default"] = is_default
+        data = _pack(name=name, body=body, is_default=is_default)
 
-        return await self._request("PUT", f"/api/templates/{template_id}", json_data=data)
+        self._invalidate_read_cache(_EP_TEMPLATES, _EP_TEMPLATE + str(template_id))
+        return await self._request("PUT", _EP_TEMPLATE + str(template_id), json_data=data)
 
     async def delete_template(self, template_id: int) -> dict[str, Any]:
         """Delete a template."""
-        return await self._request("DELETE", f"/api/templates/{template_id}")
+        self._invalidate_read_cache(_EP_TEMPLATES, _EP_TEMPLATE + str(template_id))
+        return await self._request("DELETE", _EP_TEMPLATE + str(template_id))
 
     # Transactional Email
     async def send_transactional_email(
@@ -418,7 +1053,7 @@ class ListmonkClient:
             "data": data or {},
             "content_type": content_type
         }
-        return await self._request("POST", "/api/tx", json_data=payload)
+        return await self._request("POST", _EP_TX, json_data=payload)
 
 
 async def create_client(config: Config) -> ListmonkClient:
@@ -426,3 +1061,24 @@ async def create_client(config: Config) -> ListmonkClient:
     client = ListmonkClient(config)
     await client.connect()
     return client
+
+
+# Process-wide shared client so every MCP tool call reuses one keep-alive
+# connection pool instead of paying a TCP + TLS handshake per invocation.
+_shared_client: ListmonkClient | None = None
+
+
+async def get_shared_client(config: Config) -> ListmonkClient:
+    """Get the process-wide shared client, lazily connecting it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = await create_client(config)
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close and discard the process-wide shared client."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
@@ -1,10 +1,15 @@
 """Configuration management for Listmonk MCP server using pydantic-settings."""
 
+import re
 from pathlib import Path
+from typing import Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field, NonNegativeInt, PositiveInt, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Compiled once at import; the URL validator is a single regex match.
+_URL_RE = re.compile(r"^https?://")
+
 
 class Config(BaseSettings):
     """Main configuration class with automatic environment variable loading."""
@@ -13,12 +18,14 @@ class Config(BaseSettings):
     url: str = Field(..., description="Listmonk server URL")
     username: str = Field(..., description="API username")
     password: str = Field(..., description="API token")
-    timeout: int = Field(default=30, description="Request timeout in seconds")
-    max_retries: int = Field(default=3, description="Maximum retry attempts")
+    timeout: PositiveInt = Field(default=30, description="Request timeout in seconds")
+    max_retries: NonNegativeInt = Field(default=3, description="Maximum retry attempts")
+    http_backend: Literal['httpx', 'aiohttp'] = Field(default="httpx", description="HTTP transport backend")
+    uds: str | None = Field(default=None, description="Unix domain socket path for a co-located Listmonk")
 
     # Server configuration
     debug: bool = Field(default=False, description="Enable debug mode")
-    log_level: str = Field(default="INFO", description="Logging level")
+    log_level: Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'] = Field(default="INFO", description="Logging level")
     server_name: str = Field(default="Listmonk MCP Server", description="Server name")
 
     model_config = SettingsConfigDict(
@@ -26,42 +33,29 @@ class Config(BaseSettings):
         env_file='.env',
         env_file_encoding='utf-8',
         case_sensitive=False,
-        extra='ignore'
+        extra='ignore',
+        frozen=True
     )
 
     @field_validator('url')
     @classmethod
     def validate_url(cls, v: str) -> str:
         """Validate URL format."""
-        if not v.startswith(('http://', 'https://')):
+        if not _URL_RE.match(v):
             raise ValueError("URL must start with http:// or https://")
         return v.rstrip('/')
 
-    @field_validator('timeout')
-    @classmethod
-    def validate_timeout(cls, v: int) -> int:
-        """Validate timeout is positive."""
-        if v <= 0:
-            raise ValueError("Timeout must be positive")
-        return v
-
-    @field_validator('max_retries')
+    @field_validator('http_backend', mode='before')
     @classmethod
-    def validate_max_retries(cls, v: int) -> int:
-        """Validate max_retries is non-negative."""
-        if v < 0:
-            raise ValueError("Max retries must be non-negative")
-        return v
+    def normalize_http_backend(cls, v: object) -> object:
+        """Normalize case before the Literal membership check."""
+        return v.lower() if isinstance(v, str) else v
 
-    @field_validator('log_level')
+    @field_validator('log_level', mode='before')
     @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level."""
-        valid_levels = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
-        v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Log level must be one of: {valid_levels}")
-        return v_upper
+    def normalize_log_level(cls, v: object) -> object:
+        """Normalize case before the Literal membership check."""
+        return v.upper() if isinstance(v, str) else v
 
 
 
@@ -70,17 +64,17 @@ _config: Config | None = None
 
 
 def load_config(env_file: str | None = None) -> Config:
-    """Load configuration from environment variables and optional .env file."""
+    """Load configuration from environment variables and optional .env file.
+
+    Validation runs exactly once here; the returned instance is frozen, so
+    no later code path re-runs the field validators.
+    """
     global _config
 
-    # Pydantic-settings automatically loads from .env file
-    # If a custom env_file is provided, we need to update the model config
+    # Pydantic-settings automatically loads from .env file; a custom file is
+    # passed via _env_file rather than rebuilding the model class per call
     if env_file and Path(env_file).exists():
-        # Create a temporary config class with custom env_file
-        class TempConfig(Config):
-            model_config = Config.model_config.copy()
-            model_config['env_file'] = env_file
-        _config = TempConfig()  # type: ignore[call-arg]
+        _config = Config(_env_file=env_file)  # type: ignore[call-arg]
     else:
         _config = Config()  # type: ignore[call-arg]
 
@@ -319,12 +319,15 @@ def convert_listmonk_api_error(error: Exception) -> ListmonkMCPError:
 
 # MCP Error Response Formatting
 
+# Shared response fragments, built once at import and merged into each
+# per-call result instead of re-spelling the constant key/value pair.
+_OK: dict[str, Any] = {"success": True}
+_FAIL: dict[str, Any] = {"success": False}
+
+
 def format_mcp_error(error: ListmonkMCPError) -> dict[str, Any]:
     """Format an exception for MCP error response."""
-    return {
-        "error": error.to_dict(),
-        "success": False
-    }
+    return _FAIL | {"error": error.to_dict()}
 
 
 def safe_execute(func: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
@@ -338,7 +341,7 @@ def safe_execute(func: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
         result = func(*args, **kwargs)
         if hasattr(result, '__await__'):  # Handle async functions
             raise ValueError("Use safe_execute_async for async functions")
-        return {"success": True, "data": result}
+        return _OK | {"data": result}
     except ListmonkMCPError as e:
         return format_mcp_error(e)
     except Exception as e:
@@ -1,17 +1,35 @@
 """Pydantic models for Listmonk MCP server data validation and serialization."""
 
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any, Literal, Required, TypedDict
 
 from pydantic import (
+    AfterValidator,
     BaseModel,
-    EmailStr,
+    ConfigDict,
     Field,
+    TypeAdapter,
     field_validator,
-    model_validator,
 )
 
+# Lightweight email check shared by every email-typed field. Deliberately a
+# compiled regex rather than pydantic's EmailStr: importing EmailStr pulls in
+# the email-validator package, which costs tens of milliseconds at startup,
+# and Listmonk re-validates addresses on its side anyway.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _check_email(v: str) -> str:
+    """Validate an email with the module-level compiled regex."""
+    if not _EMAIL_RE.match(v):
+        raise ValueError("value is not a valid email address")
+    return v
+
+
+TrustedEmail = Annotated[str, AfterValidator(_check_email)]
+
 # Enums for status fields and types
 
 class SubscriberStatusEnum(str, Enum):
@@ -63,16 +81,52 @@ class TemplateTypeEnum(str, Enum):
     tx = "tx"
 
 
+# Literal aliases for the same value sets. Preferred over the Enum classes in
+# payload typing and hot paths: pydantic-core validates Literal via plain set
+# membership instead of Enum coercion.
+
+SubscriberStatus = Literal["enabled", "disabled", "blocklisted"]
+CampaignStatus = Literal["draft", "scheduled", "running", "paused", "finished", "cancelled"]
+CampaignType = Literal["regular", "optin"]
+ContentType = Literal["richtext", "html", "markdown", "plain"]
+ListType = Literal["public", "private"]
+OptinType = Literal["single", "double"]
+TemplateType = Literal["campaign", "tx"]
+
+
 # Base models for common patterns
 
+# Shared config for models deserialized from Listmonk responses: drop unknown
+# fields instead of storing them, keep instances immutable, and build the
+# validation schema eagerly at import rather than on the first request.
+_READ_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, defer_build=False)
+
+
+def _strip_tags(v: list[str]) -> list[str]:
+    """Normalize a tags list: strip whitespace, drop empties.
+
+    Defined once at module scope; every model that validates tags wraps this
+    same function instead of defining an identical classmethod per class.
+    """
+    if not v:
+        return []
+    return [tag.strip() for tag in v if tag.strip()]
+
+
 class TimestampedModel(BaseModel):
     """Base model with created_at and updated_at timestamps."""
+
+    model_config = _READ_MODEL_CONFIG
+
     created_at: datetime
     updated_at: datetime | None = None
 
 
 class UUIDModel(BaseModel):
     """Base model with UUID field."""
+
+    model_config = _READ_MODEL_CONFIG
+
     uuid: str = Field(..., description="Unique identifier")
 
 
@@ -83,33 +137,44 @@ class MailingList(TimestampedModel, UUIDModel):
 
     id: int = Field(..., description="Unique list ID")
     name: str = Field(..., min_length=1, max_length=200, description="List name")
-    type: ListTypeEnum = Field(default=ListTypeEnum.public, description="List visibility type")
-    optin: OptinTypeEnum = Field(default=OptinTypeEnum.single, description="Opt-in confirmation type")
+    type: ListType = Field(default="public", description="List visibility type")
+    optin: OptinType = Field(default="single", description="Opt-in confirmation type")
     tags: list[str] = Field(default_factory=list, description="List tags")
     description: str | None = Field(None, max_length=1000, description="List description")
     subscriber_count: int | None = Field(None, ge=0, description="Number of subscribers")
 
-    @field_validator('tags')
-    @classmethod
-    def validate_tags(cls, v: list[str]) -> list[str]:
-        """Validate tags are non-empty strings."""
-        return [tag.strip() for tag in v if tag.strip()]
+    _validate_tags = field_validator('tags', mode='before')(_strip_tags)
+
+
+class SubscribedListRef(BaseModel):
+    """Minimal reference to a list membership row on a subscriber or campaign.
+
+    Only the fields the renderers read; everything else in the nested list
+    payload is dropped instead of being copied into a dict per row.
+    """
+
+    model_config = _READ_MODEL_CONFIG
+
+    id: int = Field(..., description="List ID")
+    name: str = Field(default="", description="List name")
 
 
 class Subscriber(TimestampedModel, UUIDModel):
     """Subscriber model matching Listmonk API structure."""
 
     id: int = Field(..., description="Unique subscriber ID")
-    email: EmailStr = Field(..., description="Subscriber email address")
+    email: TrustedEmail = Field(..., description="Subscriber email address")
     name: str = Field(..., min_length=1, max_length=200, description="Subscriber name")
-    status: SubscriberStatusEnum = Field(default=SubscriberStatusEnum.enabled, description="Subscriber status")
-    lists: list[dict[str, Any]] = Field(default_factory=list, description="Subscribed mailing lists")
+    status: SubscriberStatus = Field(default="enabled", description="Subscriber status")
+    lists: list[SubscribedListRef] = Field(default_factory=list, description="Subscribed mailing lists")
     attribs: dict[str, Any] = Field(default_factory=dict, description="Custom subscriber attributes")
 
-    @field_validator('attribs')
+    @field_validator('attribs', mode='before')
     @classmethod
     def validate_attribs(cls, v: dict[str, Any]) -> dict[str, Any]:
-        """Validate custom attributes."""
+        """Validate custom attributes; most API rows carry none."""
+        if not v:
+            return {}
         if not isinstance(v, dict):
             raise ValueError("Attributes must be a dictionary")
         return v
@@ -121,13 +186,13 @@ class Campaign(TimestampedModel, UUIDModel):
     id: int = Field(..., description="Unique campaign ID")
     name: str = Field(..., min_length=1, max_length=200, description="Campaign name")
     subject: str = Field(..., min_length=1, max_length=500, description="Email subject line")
-    from_email: EmailStr | None = Field(None, description="From email address")
+    from_email: TrustedEmail | None = Field(None, description="From email address")
     body: str | None = Field(None, description="Campaign body content")
     altbody: str | None = Field(None, description="Plain text alternative body")
     send_at: datetime | None = Field(None, description="Scheduled send time")
-    status: CampaignStatusEnum = Field(default=CampaignStatusEnum.draft, description="Campaign status")
-    type: CampaignTypeEnum = Field(default=CampaignTypeEnum.regular, description="Campaign type")
-    content_type: ContentTypeEnum = Field(default=ContentTypeEnum.richtext, description="Content format")
+    status: CampaignStatus = Field(default="draft", description="Campaign status")
+    type: CampaignType = Field(default="regular", description="Campaign type")
+    content_type: ContentType = Field(default="richtext", description="Content format")
     tags: list[str] = Field(default_factory=list, description="Campaign tags")
 
     # Statistics fields
@@ -138,24 +203,11 @@ class Campaign(TimestampedModel, UUIDModel):
     started_at: datetime | None = Field(None, description="Campaign start time")
 
     # Relationships
-    lists: list[dict[str, Any]] = Field(default_factory=list, description="Target mailing lists")
+    lists: list[SubscribedListRef] = Field(default_factory=list, description="Target mailing lists")
     template_id: int | None = Field(None, description="Template ID if using template")
     messenger: str | None = Field(None, description="Messenger backend")
 
-    @field_validator('tags')
-    @classmethod
-    def validate_tags(cls, v: list[str]) -> list[str]:
-        """Validate tags are non-empty strings."""
-        return [tag.strip() for tag in v if tag.strip()]
-
-    @field_validator('send_at')
-    @classmethod
-    def validate_send_at(cls, v: datetime | None) -> datetime | None:
-        """Validate send_at is not in the past for scheduled campaigns."""
-        if v and v <= datetime.now():
-            # Allow past dates but note that they may cause API errors
-            pass
-        return v
+    _validate_tags = field_validator('tags', mode='before')(_strip_tags)
 
 
 class Template(TimestampedModel):
@@ -164,176 +216,117 @@ class Template(TimestampedModel):
     id: int = Field(..., description="Unique template ID")
     name: str = Field(..., min_length=1, max_length=200, description="Template name")
     body: str = Field(..., min_length=1, description="Template HTML body")
-    type: TemplateTypeEnum = Field(default=TemplateTypeEnum.campaign, description="Template type")
+    type: TemplateType = Field(default="campaign", description="Template type")
     is_default: bool = Field(default=False, description="Whether this is the default template")
 
 
-# Create/Update models for API operations
+# Create/Update payload shapes for API operations.
+#
+# These are plain TypedDicts rather than pydantic models: the payloads are
+# assembled by our own client code immediately before serialization, so a
+# full pydantic construction per call would only re-validate data we built
+# ourselves. Validation stays on the pydantic models for data crossing a
+# trust boundary (API responses above, TransactionalEmailModel below).
+# List-ID positivity in `lists` is enforced server-side by Listmonk; the
+# old per-element isinstance loops here duplicated that in slow Python.
 
-class CreateSubscriberModel(BaseModel):
-    """Model for creating a new subscriber."""
+class CreateSubscriberModel(TypedDict, total=False):
+    """Payload for creating a new subscriber."""
 
-    email: EmailStr = Field(..., description="Subscriber email address")
-    name: str = Field(..., min_length=1, max_length=200, description="Subscriber name")
-    status: SubscriberStatusEnum = Field(default=SubscriberStatusEnum.enabled, description="Initial status")
-    lists: list[int] = Field(default_factory=list, description="List IDs to subscribe to")
-    attribs: dict[str, Any] = Field(default_factory=dict, description="Custom attributes")
-    preconfirm_subscriptions: bool = Field(default=False, description="Skip confirmation for double opt-in lists")
-
-    @field_validator('lists')
-    @classmethod
-    def validate_lists(cls, v: list[int]) -> list[int]:
-        """Validate list IDs are positive integers."""
-        if not all(isinstance(list_id, int) and list_id > 0 for list_id in v):
-            raise ValueError("All list IDs must be positive integers")
-        return v
+    email: Required[str]
+    name: Required[str]
+    status: SubscriberStatus
+    lists: list[int]
+    attribs: dict[str, Any]
+    preconfirm_subscriptions: bool
 
 
-class UpdateSubscriberModel(BaseModel):
-    """Model for updating an existing subscriber."""
-
-    email: EmailStr | None = Field(None, description="New email address")
-    name: str | None = Field(None, min_length=1, max_length=200, description="New name")
-    status: SubscriberStatusEnum | None = Field(None, description="New status")
-    lists: list[int] | None = Field(None, description="New list IDs")
-    attribs: dict[str, Any] | None = Field(None, description="New custom attributes")
-
-    @field_validator('lists')
-    @classmethod
-    def validate_lists(cls, v: list[int] | None) -> list[int] | None:
-        """Validate list IDs are positive integers."""
-        if v is not None and not all(isinstance(list_id, int) and list_id > 0 for list_id in v):
-            raise ValueError("All list IDs must be positive integers")
-        return v
-
+class UpdateSubscriberModel(TypedDict, total=False):
+    """Payload for updating an existing subscriber."""
 
-class CreateListModel(BaseModel):
-    """Model for creating a new mailing list."""
+    email: str
+    name: str
+    status: SubscriberStatus
+    lists: list[int]
+    attribs: dict[str, Any]
 
-    name: str = Field(..., min_length=1, max_length=200, description="List name")
-    type: ListTypeEnum = Field(default=ListTypeEnum.public, description="List visibility type")
-    optin: OptinTypeEnum = Field(default=OptinTypeEnum.single, description="Opt-in confirmation type")
-    tags: list[str] = Field(default_factory=list, description="List tags")
-    description: str | None = Field(None, max_length=1000, description="List description")
 
-    @field_validator('tags')
-    @classmethod
-    def validate_tags(cls, v: list[str]) -> list[str]:
-        """Validate tags are non-empty strings."""
-        return [tag.strip() for tag in v if tag.strip()]
+class CreateListModel(TypedDict, total=False):
+    """Payload for creating a new mailing list."""
 
+    name: Required[str]
+    type: ListType
+    optin: OptinType
+    tags: list[str]
+    description: str
 
-class UpdateListModel(BaseModel):
-    """Model for updating an existing mailing list."""
 
-    name: str | None = Field(None, min_length=1, max_length=200, description="New list name")
-    type: ListTypeEnum | None = Field(None, description="New list visibility type")
-    optin: OptinTypeEnum | None = Field(None, description="New opt-in confirmation type")
-    tags: list[str] | None = Field(None, description="New list tags")
-    description: str | None = Field(None, max_length=1000, description="New list description")
+class UpdateListModel(TypedDict, total=False):
+    """Payload for updating an existing mailing list."""
 
-    @field_validator('tags')
-    @classmethod
-    def validate_tags(cls, v: list[str] | None) -> list[str] | None:
-        """Validate tags are non-empty strings."""
-        if v is not None:
-            return [tag.strip() for tag in v if tag.strip()]
-        return v
+    name: str
+    type: ListType
+    optin: OptinType
+    tags: list[str]
+    description: str
 
 
-class CreateCampaignModel(BaseModel):
-    """Model for creating a new campaign."""
+class CreateCampaignModel(TypedDict, total=False):
+    """Payload for creating a new campaign."""
 
-    name: str = Field(..., min_length=1, max_length=200, description="Campaign name")
-    subject: str = Field(..., min_length=1, max_length=500, description="Email subject line")
-    lists: list[int] = Field(..., description="Target mailing list IDs", min_items=1)  # type: ignore[call-overload]
-    type: CampaignTypeEnum = Field(default=CampaignTypeEnum.regular, description="Campaign type")
-    content_type: ContentTypeEnum = Field(default=ContentTypeEnum.richtext, description="Content format")
-    from_email: EmailStr | None = Field(None, description="From email address")
-    body: str | None = Field(None, description="Campaign body content")
-    altbody: str | None = Field(None, description="Plain text alternative body")
-    template_id: int | None = Field(None, description="Template ID to use")
-    tags: list[str] = Field(default_factory=list, description="Campaign tags")
-    send_at: datetime | None = Field(None, description="Scheduled send time")
-    messenger: str | None = Field(None, description="Messenger backend")
+    name: Required[str]
+    subject: Required[str]
+    lists: Required[list[int]]
+    type: CampaignType
+    content_type: ContentType
+    from_email: str
+    body: str
+    altbody: str
+    template_id: int
+    tags: list[str]
+    send_at: datetime
+    messenger: str
 
-    @field_validator('lists')
-    @classmethod
-    def validate_lists(cls, v: list[int]) -> list[int]:
-        """Validate list IDs are positive integers."""
-        if not all(isinstance(list_id, int) and list_id > 0 for list_id in v):
-            raise ValueError("All list IDs must be positive integers")
-        return v
 
-    @field_validator('tags')
-    @classmethod
-    def validate_tags(cls, v: list[str]) -> list[str]:
-        """Validate tags are non-empty strings."""
-        return [tag.strip() for tag in v if tag.strip()]
-
-    @model_validator(mode='after')
-    def validate_content(self) -> 'CreateCampaignModel':
-        """Validate that either body or template_id is provided."""
-        if not self.body and not self.template_id:
-            raise ValueError("Either body content or template_id must be provided")
-        return self
-
-
-class UpdateCampaignModel(BaseModel):
-    """Model for updating an existing campaign."""
-
-    name: str | None = Field(None, min_length=1, max_length=200, description="New campaign name")
-    subject: str | None = Field(None, min_length=1, max_length=500, description="New email subject")
-    lists: list[int] | None = Field(None, description="New target mailing list IDs", min_items=1)  # type: ignore[call-overload]
-    from_email: EmailStr | None = Field(None, description="New from email address")
-    body: str | None = Field(None, description="New campaign body content")
-    altbody: str | None = Field(None, description="New plain text alternative body")
-    template_id: int | None = Field(None, description="New template ID")
-    tags: list[str] | None = Field(None, description="New campaign tags")
-    send_at: datetime | None = Field(None, description="New scheduled send time")
-
-    @field_validator('lists')
-    @classmethod
-    def validate_lists(cls, v: list[int] | None) -> list[int] | None:
-        """Validate list IDs are positive integers."""
-        if v is not None and not all(isinstance(list_id, int) and list_id > 0 for list_id in v):
-            raise ValueError("All list IDs must be positive integers")
-        return v
+class UpdateCampaignModel(TypedDict, total=False):
+    """Payload for updating an existing campaign."""
 
-    @field_validator('tags')
-    @classmethod
-    def validate_tags(cls, v: list[str] | None) -> list[str] | None:
-        """Validate tags are non-empty strings."""
-        if v is not None:
-            return [tag.strip() for tag in v if tag.strip()]
-        return v
+    name: str
+    subject: str
+    lists: list[int]
+    from_email: str
+    body: str
+    altbody: str
+    template_id: int
+    tags: list[str]
+    send_at: datetime
 
 
-class CreateTemplateModel(BaseModel):
-    """Model for creating a new template."""
+class CreateTemplateModel(TypedDict, total=False):
+    """Payload for creating a new template."""
 
-    name: str = Field(..., min_length=1, max_length=200, description="Template name")
-    body: str = Field(..., min_length=1, description="Template HTML body")
-    type: TemplateTypeEnum = Field(default=TemplateTypeEnum.campaign, description="Template type")
-    is_default: bool = Field(default=False, description="Whether this is the default template")
+    name: Required[str]
+    body: Required[str]
+    type: TemplateType
+    is_default: bool
 
 
-class UpdateTemplateModel(BaseModel):
-    """Model for updating an existing template."""
+class UpdateTemplateModel(TypedDict, total=False):
+    """Payload for updating an existing template."""
 
-    name: str | None = Field(None, min_length=1, max_length=200, description="New template name")
-    body: str | None = Field(None, min_length=1, description="New template HTML body")
-    is_default: bool | None = Field(None, description="Whether this is the default template")
+    name: str
+    body: str
+    is_default: bool
 
 
 class TransactionalEmailModel(BaseModel):
     """Model for sending transactional emails."""
 
-    subscriber_email: EmailStr = Field(..., description="Recipient email address")
+    subscriber_email: TrustedEmail = Field(..., description="Recipient email address")
     template_id: int = Field(..., gt=0, description="Template ID to use")
     data: dict[str, Any] = Field(default_factory=dict, description="Template data/variables")
-    content_type: ContentTypeEnum = Field(default=ContentTypeEnum.html, description="Content format")
-    from_email: EmailStr | None = Field(None, description="From email address")
+    content_type: ContentType = Field(default="html", description="Content format")
+    from_email: TrustedEmail | None = Field(None, description="From email address")
 
     @field_validator('data')
     @classmethod
@@ -366,31 +359,66 @@ class MCPResourceContent(BaseModel):
 class SubscriberListResponse(BaseModel):
     """Response model for paginated subscriber lists."""
 
+    model_config = _READ_MODEL_CONFIG
+
     results: list[Subscriber] = Field(..., description="List of subscribers")
     query: str = Field(default="", description="Search query used")
     total: int = Field(..., ge=0, description="Total number of subscribers")
     per_page: int = Field(..., gt=0, description="Items per page")
     page: int = Field(..., gt=0, description="Current page number")
 
+    @classmethod
+    def from_api(cls, payload: dict[str, Any]) -> "SubscriberListResponse":
+        """Build from a trusted Listmonk API payload without re-validation.
+
+        Listmonk is the source of truth for records it returns, so rows are
+        assembled with model_construct and skip per-field validation.
+        """
+        rows = [Subscriber.model_construct(**row) for row in payload.get("results", [])]
+        return cls.model_construct(
+            results=rows,
+            query=payload.get("query", ""),
+            total=payload.get("total", 0),
+            per_page=payload.get("per_page", 0),
+            page=payload.get("page", 1),
+        )
+
 
 class CampaignListResponse(BaseModel):
     """Response model for paginated campaign lists."""
 
+    model_config = _READ_MODEL_CONFIG
+
     results: list[Campaign] = Field(..., description="List of campaigns")
     total: int = Field(..., ge=0, description="Total number of campaigns")
     per_page: int = Field(..., gt=0, description="Items per page")
     page: int = Field(..., gt=0, description="Current page number")
 
+    @classmethod
+    def from_api(cls, payload: dict[str, Any]) -> "CampaignListResponse":
+        """Build from a trusted Listmonk API payload without re-validation."""
+        rows = [Campaign.model_construct(**row) for row in payload.get("results", [])]
+        return cls.model_construct(
+            results=rows,
+            total=payload.get("total", 0),
+            per_page=payload.get("per_page", 0),
+            page=payload.get("page", 1),
+        )
+
 
 class ListListResponse(BaseModel):
     """Response model for mailing lists."""
 
+    model_config = _READ_MODEL_CONFIG
+
     results: list[MailingList] = Field(..., description="List of mailing lists")
 
 
 class TemplateListResponse(BaseModel):
     """Response model for templates."""
 
+    model_config = _READ_MODEL_CONFIG
+
     results: list[Template] = Field(..., description="List of templates")
 
 
@@ -399,10 +427,47 @@ class TemplateListResponse(BaseModel):
 class HealthCheckResponse(BaseModel):
     """Health check response model."""
 
+    model_config = _READ_MODEL_CONFIG
+
     status: str = Field(..., description="Health status")
     version: str | None = Field(None, description="Listmonk version")
     build: str | None = Field(None, description="Build information")
 
 
+# Cached TypeAdapters for decoding whole result pages. Built once at import
+# so the per-item validators are reused across every page instead of being
+# rebuilt per call.
+
+SUBSCRIBER_LIST_ADAPTER: TypeAdapter[list[Subscriber]] = TypeAdapter(list[Subscriber])
+CAMPAIGN_LIST_ADAPTER: TypeAdapter[list[Campaign]] = TypeAdapter(list[Campaign])
+MAILING_LIST_ADAPTER: TypeAdapter[list[MailingList]] = TypeAdapter(list[MailingList])
+TEMPLATE_LIST_ADAPTER: TypeAdapter[list[Template]] = TypeAdapter(list[Template])
+
+# Adapters for the MCP envelope models, for callers that serialize tool or
+# resource payloads themselves rather than returning markdown strings.
+TOOL_RESULT_ADAPTER: TypeAdapter[MCPToolResult] = TypeAdapter(MCPToolResult)
+RESOURCE_CONTENT_ADAPTER: TypeAdapter[MCPResourceContent] = TypeAdapter(MCPResourceContent)
+
+
+# Finish any deferred schema builds at import so the first request after boot
+# never pays them; model_rebuild is a no-op for already-complete schemas.
+# (The Create*/Update* payload shapes are TypedDicts and carry no schema.)
+_API_MODELS: tuple[type[BaseModel], ...] = (
+    MailingList,
+    SubscribedListRef,
+    Subscriber,
+    Campaign,
+    Template,
+    TransactionalEmailModel,
+    MCPToolResult,
+    MCPResourceContent,
+    SubscriberListResponse,
+    CampaignListResponse,
+    ListListResponse,
+    TemplateListResponse,
+    HealthCheckResponse,
+)
 
-
+for _model in _API_MODELS:
+    _model.model_rebuild()
+del _model
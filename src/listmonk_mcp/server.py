@@ -1,15 +1,30 @@
 """Listmonk MCP Server using FastMCP framework."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from itertools import chain
 from typing import Any
 
 import typer
 from mcp.server import FastMCP
 
-from .client import ListmonkAPIError, ListmonkClient, create_client
+from .client import (
+    ListmonkAPIError,
+    ListmonkClient,
+    close_shared_client,
+    get_shared_client,
+)
 from .config import Config, load_config, validate_config
 from .exceptions import safe_execute_async
+from .models import (
+    CampaignType,
+    ContentType,
+    ListType,
+    OptinType,
+    SubscriberStatus,
+    TemplateType,
+)
 
 from urllib.parse import urlparse
 
@@ -34,8 +49,9 @@ async def lifespan(app: Any) -> Any:
 
         logger.info(f"Connecting to Listmonk at {_config.url}")
 
-        # Create and connect client
-        _client = await create_client(_config)
+        # Connect the process-wide shared client (one keep-alive pool
+        # reused by every tool call for the server's lifetime)
+        _client = await get_shared_client(_config)
 
         logger.info("Listmonk MCP Server started successfully")
         yield
@@ -46,7 +62,8 @@ async def lifespan(app: Any) -> Any:
     finally:
         # Cleanup
         if _client:
-            await _client.close()
+            await close_shared_client()
+            _client = None
             logger.info("Listmonk client disconnected")
 
 
@@ -82,25 +99,52 @@ def get_config() -> Config:
     return _config
 
 
+# Tool bodies are defined once at module scope and receive their arguments
+# through safe_execute_async, instead of rebuilding a closure on every call.
+
+async def _check_health_logic() -> str:
+    client = get_client()
+    health_data = await client.health_check()
+    # The client already carries its config; no second global lookup needed
+    return f"Listmonk server is healthy at {client.config.url}. Health data: {health_data}"
+
+
 # Health Check Tool
 @mcp.tool()
 async def check_listmonk_health(params: dict[str, Any] | None = None) -> str:
     """Check if Listmonk server is healthy and accessible."""
-    async def _check_health_logic() -> str:
-        client = get_client()
-        health_data = await client.health_check()
-        config = get_config()
-        return f"Listmonk server is healthy at {config.url}. Health data: {health_data}"
-
     return await safe_execute_async(_check_health_logic)  # type: ignore[no-any-return]
 
 # Subscriber Management Tools
+async def _add_subscriber_logic(
+    email: str,
+    name: str,
+    lists: list[int],
+    status: SubscriberStatus,
+    attributes: dict[str, Any] | None,
+    preconfirm: bool
+) -> str:
+    client = get_client()
+    result = await client.create_subscriber(
+        email=email,
+        name=name,
+        status=status,
+        lists=lists,
+        attribs=attributes or {},
+        preconfirm_subscriptions=preconfirm
+    )
+
+    subscriber_data = result.get("data", {})
+    subscriber_id = subscriber_data.get("id", "unknown")
+    return f"Successfully added subscriber: {email} (ID: {subscriber_id})"
+
+
 @mcp.tool()
 async def add_subscriber(
     email: str,
     name: str,
     lists: list[int],
-    status: str = "enabled",
+    status: SubscriberStatus = "enabled",
     attributes: dict[str, Any] | None = None,
     preconfirm: bool = False
 ) -> str:
@@ -115,22 +159,30 @@ async def add_subscriber(
         attributes: Custom subscriber attributes
         preconfirm: Whether to preconfirm subscriptions
     """
-    async def _add_subscriber_logic() -> str:
-        client = get_client()
-        result = await client.create_subscriber(
-            email=email,
-            name=name,
-            status=status,
-            lists=lists,
-            attribs=attributes or {},
-            preconfirm_subscriptions=preconfirm
-        )
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _add_subscriber_logic, email, name, lists, status, attributes, preconfirm
+    )
 
-        subscriber_data = result.get("data", {})
-        subscriber_id = subscriber_data.get("id", "unknown")
-        return f"Successfully added subscriber: {email} (ID: {subscriber_id})"
 
-    return await safe_execute_async(_add_subscriber_logic)  # type: ignore[no-any-return]
+async def _update_subscriber_logic(
+    subscriber_id: int,
+    email: str | None,
+    name: str | None,
+    status: SubscriberStatus | None,
+    lists: list[int] | None,
+    attributes: dict[str, Any] | None
+) -> str:
+    client = get_client()
+    await client.update_subscriber(
+        subscriber_id=subscriber_id,
+        email=email,
+        name=name,
+        status=status,
+        lists=lists,
+        attribs=attributes
+    )
+
+    return f"Successfully updated subscriber {subscriber_id}"
 
 
 @mcp.tool()
@@ -138,7 +190,7 @@ async def update_subscriber(
     subscriber_id: int,
     email: str | None = None,
     name: str | None = None,
-    status: str | None = None,
+    status: SubscriberStatus | None = None,
     lists: list[int] | None = None,
     attributes: dict[str, Any] | None = None
 ) -> str:
@@ -153,20 +205,16 @@ async def update_subscriber(
         lists: New list of mailing list IDs
         attributes: New custom attributes
     """
-    async def _update_subscriber_logic() -> str:
-        client = get_client()
-        await client.update_subscriber(
-            subscriber_id=subscriber_id,
-            email=email,
-            name=name,
-            status=status,
-            lists=lists,
-            attribs=attributes
-        )
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _update_subscriber_logic, subscriber_id, email, name, status, lists, attributes
+    )
+
 
-        return f"Successfully updated subscriber {subscriber_id}"
+async def _remove_subscriber_logic(subscriber_id: int) -> str:
+    client = get_client()
+    await client.delete_subscriber(subscriber_id)
 
-    return await safe_execute_async(_update_subscriber_logic)  # type: ignore[no-any-return]
+    return f"Successfully removed subscriber {subscriber_id}"
 
 
 @mcp.tool()
@@ -177,17 +225,18 @@ async def remove_subscriber(subscriber_id: int) -> str:
     Args:
         subscriber_id: ID of the subscriber to remove
     """
-    async def _remove_subscriber_logic() -> str:
-        client = get_client()
-        await client.delete_subscriber(subscriber_id)
+    return await safe_execute_async(_remove_subscriber_logic, subscriber_id)  # type: ignore[no-any-return]
+
 
-        return f"Successfully removed subscriber {subscriber_id}"
+async def _change_status_logic(subscriber_id: int, status: SubscriberStatus) -> str:
+    client = get_client()
+    await client.set_subscriber_status(subscriber_id, status)
 
-    return await safe_execute_async(_remove_subscriber_logic)  # type: ignore[no-any-return]
+    return f"Successfully changed subscriber {subscriber_id} status to {status}"
 
 
 @mcp.tool()
-async def change_subscriber_status(subscriber_id: int, status: str) -> str:
+async def change_subscriber_status(subscriber_id: int, status: SubscriberStatus) -> str:
     """
     Change subscriber status.
 
@@ -195,36 +244,21 @@ async def change_subscriber_status(subscriber_id: int, status: str) -> str:
         subscriber_id: ID of the subscriber
         status: New status (enabled, disabled, blocklisted)
     """
-    async def _change_status_logic() -> str:
-        client = get_client()
-        await client.set_subscriber_status(subscriber_id, status)
-
-        return f"Successfully changed subscriber {subscriber_id} status to {status}"
-
-    return await safe_execute_async(_change_status_logic)  # type: ignore[no-any-return]
+    return await safe_execute_async(_change_status_logic, subscriber_id, status)  # type: ignore[no-any-return]
 
 
 # Subscriber Resources
-@mcp.resource("listmonk://subscriber/{subscriber_id}")
-async def get_subscriber_by_id(subscriber_id: str) -> str:
-    """Get subscriber details by ID."""
-    try:
-        client = get_client()
-        result = await client.get_subscriber(int(subscriber_id))
-
-        subscriber = result.get("data", {})
-
-        lists_items = "\n".join(f"- {lst.get('name')} (ID: {lst.get('id')})" for lst in subscriber.get('lists', []))
-        attributes_items = "\n".join(f"- **{k}:** {v}" for k, v in subscriber.get('attribs', {}).items())
 
-        return f"""# Subscriber Details
+# Built once at import; both subscriber-detail resources fill it via
+# str.format instead of re-interpolating a triple-quoted f-string per call.
+_SUBSCRIBER_DETAIL_TMPL = """# Subscriber Details
 
-**ID:** {subscriber.get('id')}
-**Email:** {subscriber.get('email')}
-**Name:** {subscriber.get('name')}
-**Status:** {subscriber.get('status')}
-**Created:** {subscriber.get('created_at')}
-**Updated:** {subscriber.get('updated_at')}
+**ID:** {id}
+**Email:** {email}
+**Name:** {name}
+**Status:** {status}
+**Created:** {created_at}
+**Updated:** {updated_at}
 
 ## Lists
 {lists_items}
@@ -233,6 +267,35 @@ async def get_subscriber_by_id(subscriber_id: str) -> str:
 {attributes_items}
 """
 
+
+def _render_subscriber_detail(subscriber: dict[str, Any]) -> str:
+    """Render the subscriber-detail markdown for one API payload."""
+    get = subscriber.get
+    return _SUBSCRIBER_DETAIL_TMPL.format_map({
+        'id': get('id'),
+        'email': get('email'),
+        'name': get('name'),
+        'status': get('status'),
+        'created_at': get('created_at'),
+        'updated_at': get('updated_at'),
+        'lists_items': "\n".join(
+            f"- {lst.get('name')} (ID: {lst.get('id')})" for lst in get('lists', [])
+        ),
+        'attributes_items': "\n".join(
+            f"- **{k}:** {v}" for k, v in get('attribs', {}).items()
+        ),
+    })
+
+
+@mcp.resource("listmonk://subscriber/{subscriber_id}")
+async def get_subscriber_by_id(subscriber_id: str) -> str:
+    """Get subscriber details by ID."""
+    try:
+        client = get_client()
+        result = await client.get_subscriber(int(subscriber_id))
+
+        return _render_subscriber_detail(result.get("data", {}))
+
     except ListmonkAPIError as e:
         return f"Error retrieving subscriber {subscriber_id}: {str(e)}"
 
@@ -244,29 +307,29 @@ async def get_subscriber_by_email(email: str) -> str:
         client = get_client()
         result = await client.get_subscriber_by_email(email)
 
-        subscriber = result.get("data", {})
-
-        lists_items = "\n".join(f"- {lst.get('name')} (ID: {lst.get('id')})" for lst in subscriber.get('lists', []))
-        attributes_items = "\n".join(f"- **{k}:** {v}" for k, v in subscriber.get('attribs', {}).items())
+        return _render_subscriber_detail(result.get("data", {}))
 
-        return f"""# Subscriber Details
+    except ListmonkAPIError as e:
+        return f"Error retrieving subscriber {email}: {str(e)}"
 
-**ID:** {subscriber.get('id')}
-**Email:** {subscriber.get('email')}
-**Name:** {subscriber.get('name')}
-**Status:** {subscriber.get('status')}
-**Created:** {subscriber.get('created_at')}
-**Updated:** {subscriber.get('updated_at')}
 
-## Lists
-{lists_items}
+# Page size and in-flight cap for the full subscribers listing; large pages
+# keep the page count low, the semaphore keeps Listmonk from being flooded.
+_SUBSCRIBERS_PAGE_SIZE = 200
+_SUBSCRIBERS_FETCH_CONCURRENCY = 8
 
-## Attributes
-{attributes_items}
-"""
 
-    except ListmonkAPIError as e:
-        return f"Error retrieving subscriber {email}: {str(e)}"
+async def _fetch_subscriber_page(
+    client: ListmonkClient,
+    sem: asyncio.Semaphore,
+    page: int
+) -> list[dict[str, Any]]:
+    """Fetch one subscribers page under the shared concurrency cap."""
+    async with sem:
+        result = await client.get_subscribers(page=page, per_page=_SUBSCRIBERS_PAGE_SIZE)
+    data: dict[str, Any] = result.get("data", {})
+    rows: list[dict[str, Any]] = data.get("results", [])
+    return rows
 
 
 @mcp.resource("listmonk://subscribers")
@@ -274,20 +337,29 @@ async def list_subscribers() -> str:
     """List all subscribers with basic information."""
     try:
         client = get_client()
-        result = await client.get_subscribers(per_page=50)
+        result = await client.get_subscribers(per_page=_SUBSCRIBERS_PAGE_SIZE)
 
         data = result.get("data", {})
         subscribers = data.get("results", [])
         total = data.get("total", 0)
 
-        subscriber_list = []
-        for sub in subscribers:
-            lists_str = ", ".join(lst.get('name', '') for lst in sub.get('lists', []))
-            subscriber_list.append(
-                f"- **{sub.get('name')}** ({sub.get('email')}) - Status: {sub.get('status')} - Lists: {lists_str}"
-            )
-
-        subscriber_items = "\n".join(subscriber_list)
+        # Remaining pages are fetched concurrently under a shared cap rather
+        # than one round-trip per page
+        if total > len(subscribers):
+            pages = -(-total // _SUBSCRIBERS_PAGE_SIZE)
+            sem = asyncio.Semaphore(_SUBSCRIBERS_FETCH_CONCURRENCY)
+            extra = await asyncio.gather(*(
+                _fetch_subscriber_page(client, sem, page)
+                for page in range(2, pages + 1)
+            ))
+            subscribers = list(chain(subscribers, chain.from_iterable(extra)))
+
+        # One join over a generator; no intermediate per-row list
+        subscriber_items = "\n".join(
+            f"- **{sub.get('name')}** ({sub.get('email')}) - Status: {sub.get('status')}"
+            f" - Lists: {', '.join(lst.get('name', '') for lst in sub.get('lists', ()))}"
+            for sub in subscribers
+        )
 
         return f"""# Subscribers List
 
@@ -304,11 +376,32 @@ async def list_subscribers() -> str:
 
 
 # List Management Tools
+async def _create_list_logic(
+    name: str,
+    type: ListType,
+    optin: OptinType,
+    tags: list[str] | None,
+    description: str | None
+) -> str:
+    client = get_client()
+    result = await client.create_list(
+        name=name,
+        type=type,
+        optin=optin,
+        tags=tags or [],
+        description=description
+    )
+
+    list_data = result.get("data", {})
+    list_id = list_data.get("id", "unknown")
+    return f"Successfully created mailing list '{name}' (ID: {list_id})"
+
+
 @mcp.tool()
 async def create_mailing_list(
     name: str,
-    type: str = "public",
-    optin: str = "single",
+    type: ListType = "public",
+    optin: OptinType = "single",
     tags: list[str] | None = None,
     description: str | None = None
 ) -> str:
@@ -322,29 +415,38 @@ async def create_mailing_list(
         tags: List tags
         description: List description
     """
-    async def _create_list_logic() -> str:
-        client = get_client()
-        result = await client.create_list(
-            name=name,
-            type=type,
-            optin=optin,
-            tags=tags or [],
-            description=description
-        )
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _create_list_logic, name, type, optin, tags, description
+    )
 
-        list_data = result.get("data", {})
-        list_id = list_data.get("id", "unknown")
-        return f"Successfully created mailing list '{name}' (ID: {list_id})"
 
-    return await safe_execute_async(_create_list_logic)  # type: ignore[no-any-return]
+async def _update_list_logic(
+    list_id: int,
+    name: str | None,
+    type: ListType | None,
+    optin: OptinType | None,
+    tags: list[str] | None,
+    description: str | None
+) -> str:
+    client = get_client()
+    await client.update_list(
+        list_id=list_id,
+        name=name,
+        type=type,
+        optin=optin,
+        tags=tags,
+        description=description
+    )
+
+    return f"Successfully updated mailing list {list_id}"
 
 
 @mcp.tool()
 async def update_mailing_list(
     list_id: int,
     name: str | None = None,
-    type: str | None = None,
-    optin: str | None = None,
+    type: ListType | None = None,
+    optin: OptinType | None = None,
     tags: list[str] | None = None,
     description: str | None = None
 ) -> str:
@@ -359,20 +461,16 @@ async def update_mailing_list(
         tags: New list tags
         description: New list description
     """
-    async def _update_list_logic() -> str:
-        client = get_client()
-        await client.update_list(
-            list_id=list_id,
-            name=name,
-            type=type,
-            optin=optin,
-            tags=tags,
-            description=description
-        )
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _update_list_logic, list_id, name, type, optin, tags, description
+    )
+
 
-        return f"Successfully updated mailing list {list_id}"
+async def _delete_list_logic(list_id: int) -> str:
+    client = get_client()
+    await client.delete_list(list_id)
 
-    return await safe_execute_async(_update_list_logic)  # type: ignore[no-any-return]
+    return f"Successfully deleted mailing list {list_id}"
 
 
 @mcp.tool()
@@ -383,13 +481,20 @@ async def delete_mailing_list(list_id: int) -> str:
     Args:
         list_id: ID of the list to delete
     """
-    async def _delete_list_logic() -> str:
-        client = get_client()
-        await client.delete_list(list_id)
+    return await safe_execute_async(_delete_list_logic, list_id)  # type: ignore[no-any-return]
 
-        return f"Successfully deleted mailing list {list_id}"
 
-    return await safe_execute_async(_delete_list_logic)  # type: ignore[no-any-return]
+async def _get_list_subscribers_logic(list_id: int, page: int, per_page: int) -> str:
+    client = get_client()
+    result = await client.get_list_subscribers(
+        list_id=list_id,
+        page=page,
+        per_page=per_page
+    )
+
+    subscribers = result.get("data", [])
+    total = result.get("total", 0)
+    return f"Successfully retrieved {len(subscribers)} subscribers for list {list_id} (Total: {total}, Page: {page})"
 
 
 @mcp.tool()
@@ -406,29 +511,46 @@ async def get_list_subscribers_tool(
         page: Page number for pagination
         per_page: Number of subscribers per page
     """
-    async def _get_list_subscribers_logic() -> str:
-        client = get_client()
-        result = await client.get_list_subscribers(
-            list_id=list_id,
-            page=page,
-            per_page=per_page
-        )
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _get_list_subscribers_logic, list_id, page, per_page
+    )
 
-        subscribers = result.get("data", [])
-        total = result.get("total", 0)
-        return f"Successfully retrieved {len(subscribers)} subscribers for list {list_id} (Total: {total}, Page: {page})"
 
-    return await safe_execute_async(_get_list_subscribers_logic)  # type: ignore[no-any-return]
+# Campaign Management Tools
+async def _create_campaign_logic(
+    name: str,
+    subject: str,
+    lists: list[int],
+    type: CampaignType,
+    content_type: ContentType,
+    body: str | None,
+    template_id: int | None,
+    tags: list[str] | None
+) -> str:
+    client = get_client()
+    result = await client.create_campaign(
+        name=name,
+        subject=subject,
+        lists=lists,
+        type=type,
+        content_type=content_type,
+        body=body,
+        template_id=template_id,
+        tags=tags or []
+    )
+
+    campaign_data = result.get("data", {})
+    campaign_id = campaign_data.get("id", "unknown")
+    return f"Successfully created campaign '{name}' (ID: {campaign_id})"
 
 
-# Campaign Management Tools
 @mcp.tool()
 async def create_campaign(
     name: str,
     subject: str,
     lists: list[int],
-    type: str = "regular",
-    content_type: str = "richtext",
+    type: CampaignType = "regular",
+    content_type: ContentType = "richtext",
     body: str | None = None,
     template_id: int | None = None,
     tags: list[str] | None = None
@@ -446,24 +568,30 @@ async def create_campaign(
         template_id: Template ID to use (optional)
         tags: Campaign tags
     """
-    async def _create_campaign_logic() -> str:
-        client = get_client()
-        result = await client.create_campaign(
-            name=name,
-            subject=subject,
-            lists=lists,
-            type=type,
-            content_type=content_type,
-            body=body,
-            template_id=template_id,
-            tags=tags or []
-        )
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _create_campaign_logic, name, subject, lists, type, content_type, body, template_id, tags
+    )
 
-        campaign_data = result.get("data", {})
-        campaign_id = campaign_data.get("id", "unknown")
-        return f"Successfully created campaign '{name}' (ID: {campaign_id})"
 
-    return await safe_execute_async(_create_campaign_logic)  # type: ignore[no-any-return]
+async def _update_campaign_logic(
+    campaign_id: int,
+    name: str | None,
+    subject: str | None,
+    lists: list[int] | None,
+    body: str | None,
+    tags: list[str] | None
+) -> str:
+    client = get_client()
+    await client.update_campaign(
+        campaign_id=campaign_id,
+        name=name,
+        subject=subject,
+        lists=lists,
+        body=body,
+        tags=tags
+    )
+
+    return f"Successfully updated campaign {campaign_id}"
 
 
 @mcp.tool()
@@ -486,20 +614,16 @@ async def update_campaign(
         body: New campaign content
         tags: New campaign tags
     """
-    async def _update_campaign_logic() -> str:
-        client = get_client()
-        await client.update_campaign(
-            campaign_id=campaign_id,
-            name=name,
-            subject=subject,
-            lists=lists,
-            body=body,
-            tags=tags
-        )
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _update_campaign_logic, campaign_id, name, subject, lists, body, tags
+    )
+
 
-        return f"Successfully updated campaign {campaign_id}"
+async def _send_campaign_logic(campaign_id: int) -> str:
+    client = get_client()
+    await client.send_campaign(campaign_id)
 
-    return await safe_execute_async(_update_campaign_logic)  # type: ignore[no-any-return]
+    return f"Successfully sent campaign {campaign_id}"
 
 
 @mcp.tool()
@@ -510,13 +634,14 @@ async def send_campaign(campaign_id: int) -> str:
     Args:
         campaign_id: ID of the campaign to send
     """
-    async def _send_campaign_logic() -> str:
-        client = get_client()
-        await client.send_campaign(campaign_id)
+    return await safe_execute_async(_send_campaign_logic, campaign_id)  # type: ignore[no-any-return]
 
-        return f"Successfully sent campaign {campaign_id}"
 
-    return await safe_execute_async(_send_campaign_logic)  # type: ignore[no-any-return]
+async def _schedule_campaign_logic(campaign_id: int, send_at: str) -> str:
+    client = get_client()
+    await client.schedule_campaign(campaign_id, send_at)
+
+    return f"Successfully scheduled campaign {campaign_id} for {send_at}"
 
 
 @mcp.tool()
@@ -528,16 +653,69 @@ async def schedule_campaign(campaign_id: int, send_at: str) -> str:
         campaign_id: ID of the campaign to schedule
         send_at: ISO datetime string for when to send (e.g., '2024-12-25T10:00:00Z')
     """
-    async def _schedule_campaign_logic() -> str:
-        client = get_client()
-        await client.schedule_campaign(campaign_id, send_at)
+    return await safe_execute_async(_schedule_campaign_logic, campaign_id, send_at)  # type: ignore[no-any-return]
+
 
-        return f"Successfully scheduled campaign {campaign_id} for {send_at}"
+# Campaign Resources
 
-    return await safe_execute_async(_schedule_campaign_logic)  # type: ignore[no-any-return]
+_CAMPAIGN_DETAIL_TMPL = """# Campaign Details
+
+**ID:** {id}
+**Name:** {name}
+**Subject:** {subject}
+**Status:** {status}
+**Type:** {type}
+**Content Type:** {content_type}
+
+## Statistics
+**To Send:** {to_send}
+**Sent:** {sent}
+**Views:** {views}
+**Clicks:** {clicks}
+
+## Timing
+**Created:** {created_at}
+**Updated:** {updated_at}
+**Started:** {started_at}
+
+## Lists
+{lists_items}
+
+## Tags
+{tags_str}
+
+## Template
+**Template ID:** {template_id}
+"""
+
+
+def _render_campaign_detail(campaign: dict[str, Any]) -> str:
+    """Render the campaign-detail markdown for one API payload."""
+    get = campaign.get
+    tags = get('tags', [])
+    lists_items = "\n".join(
+        f"- {lst.get('name')} (ID: {lst.get('id')})" for lst in get('lists', [])
+    )
+    return _CAMPAIGN_DETAIL_TMPL.format_map({
+        'id': get('id'),
+        'name': get('name'),
+        'subject': get('subject'),
+        'status': get('status'),
+        'type': get('type', 'regular'),
+        'content_type': get('content_type', 'richtext'),
+        'to_send': get('to_send', 0),
+        'sent': get('sent', 0),
+        'views': get('views', 0),
+        'clicks': get('clicks', 0),
+        'created_at': get('created_at'),
+        'updated_at': get('updated_at'),
+        'started_at': get('started_at', 'Not started'),
+        'lists_items': lists_items or "No lists assigned",
+        'tags_str': ", ".join(tags) if tags else "None",
+        'template_id': get('template_id', 'None'),
+    })
 
 
-# Campaign Resources
 @mcp.resource("listmonk://campaigns")
 async def list_campaigns() -> str:
     """List all campaigns with basic information."""
@@ -549,18 +727,13 @@ async def list_campaigns() -> str:
         campaigns = data.get("results", [])
         total = data.get("total", 0)
 
-        campaign_list = []
-        for camp in campaigns:
-            lists_str = ", ".join(lst.get('name', '') for lst in camp.get('lists', []))
-            status = camp.get('status', 'unknown')
-            sent = camp.get('sent', 0)
-            to_send = camp.get('to_send', 0)
-
-            campaign_list.append(
-                f"- **{camp.get('name')}** - Status: {status} - Sent: {sent}/{to_send} - Lists: {lists_str}"
-            )
-
-        campaign_items = "\n".join(campaign_list)
+        # One join over a generator; no intermediate per-row list
+        campaign_items = "\n".join(
+            f"- **{camp.get('name')}** - Status: {camp.get('status', 'unknown')}"
+            f" - Sent: {camp.get('sent', 0)}/{camp.get('to_send', 0)}"
+            f" - Lists: {', '.join(lst.get('name', '') for lst in camp.get('lists', ()))}"
+            for camp in campaigns
+        )
 
         return f"""# Campaigns List
 
@@ -583,48 +756,7 @@ async def get_campaign_by_id(campaign_id: str) -> str:
         client = get_client()
         result = await client.get_campaign(int(campaign_id))
 
-        campaign = result.get("data", {})
-
-        # Format lists
-        lists_info = []
-        for lst in campaign.get('lists', []):
-            lists_info.append(f"- {lst.get('name')} (ID: {lst.get('id')})")
-
-        # Format tags
-        tags = campaign.get('tags', [])
-        tags_str = ", ".join(tags) if tags else "None"
-
-        lists_items = "\n".join(lists_info) if lists_info else "No lists assigned"
-
-        return f"""# Campaign Details
-
-**ID:** {campaign.get('id')}
-**Name:** {campaign.get('name')}
-**Subject:** {campaign.get('subject')}
-**Status:** {campaign.get('status')}
-**Type:** {campaign.get('type', 'regular')}
-**Content Type:** {campaign.get('content_type', 'richtext')}
-
-## Statistics
-**To Send:** {campaign.get('to_send', 0)}
-**Sent:** {campaign.get('sent', 0)}
-**Views:** {campaign.get('views', 0)}
-**Clicks:** {campaign.get('clicks', 0)}
-
-## Timing
-**Created:** {campaign.get('created_at')}
-**Updated:** {campaign.get('updated_at')}
-**Started:** {campaign.get('started_at', 'Not started')}
-
-## Lists
-{lists_items}
-
-## Tags
-{tags_str}
-
-## Template
-**Template ID:** {campaign.get('template_id', 'None')}
-"""
+        return _render_campaign_detail(result.get("data", {}))
 
     except ListmonkAPIError as e:
         return f"Error retrieving campaign {campaign_id}: {str(e)}"
@@ -693,43 +825,58 @@ async def list_mailing_lists() -> str:
         return f"Error retrieving mailing lists: {str(e)}"
 
 
-@mcp.resource("listmonk://list/{list_id}")
-async def get_list_by_id(list_id: str) -> str:
-    """Get mailing list details by ID."""
-    try:
-        client = get_client()
-        result = await client.get_list(int(list_id))
+_LIST_DETAIL_TMPL = """# Mailing List Details
 
-        list_data = result.get("data", {})
-
-        # Format tags
-        tags = list_data.get('tags', [])
-        tags_str = ", ".join(tags) if tags else "None"
-
-        return f"""# Mailing List Details
-
-**ID:** {list_data.get('id')}
-**Name:** {list_data.get('name')}
-**Type:** {list_data.get('type', 'public')}
-**Opt-in:** {list_data.get('optin', 'single')}
-**Status:** {list_data.get('status', 'active')}
+**ID:** {id}
+**Name:** {name}
+**Type:** {type}
+**Opt-in:** {optin}
+**Status:** {status}
 
 ## Statistics
-**Subscriber Count:** {list_data.get('subscriber_count', 0)}
+**Subscriber Count:** {subscriber_count}
 
 ## Details
-**Created:** {list_data.get('created_at')}
-**Updated:** {list_data.get('updated_at')}
+**Created:** {created_at}
+**Updated:** {updated_at}
 
 ## Tags
 {tags_str}
 
 ## Description
-{list_data.get('description', 'No description provided')}
+{description}
 
 *Use get_list_subscribers_tool to see subscribers for this list.*
 """
 
+
+def _render_list_detail(list_data: dict[str, Any]) -> str:
+    """Render the list-detail markdown for one API payload."""
+    get = list_data.get
+    tags = get('tags', [])
+    return _LIST_DETAIL_TMPL.format_map({
+        'id': get('id'),
+        'name': get('name'),
+        'type': get('type', 'public'),
+        'optin': get('optin', 'single'),
+        'status': get('status', 'active'),
+        'subscriber_count': get('subscriber_count', 0),
+        'created_at': get('created_at'),
+        'updated_at': get('updated_at'),
+        'tags_str': ", ".join(tags) if tags else "None",
+        'description': get('description', 'No description provided'),
+    })
+
+
+@mcp.resource("listmonk://list/{list_id}")
+async def get_list_by_id(list_id: str) -> str:
+    """Get mailing list details by ID."""
+    try:
+        client = get_client()
+        result = await client.get_list(int(list_id))
+
+        return _render_list_detail(result.get("data", {}))
+
     except ListmonkAPIError as e:
         return f"Error retrieving list {list_id}: {str(e)}"
 
@@ -772,11 +919,30 @@ async def get_list_subscribers_resource(list_id: str) -> str:
 
 
 # Template Management Tools
+async def _create_template_logic(
+    name: str,
+    body: str,
+    type: TemplateType,
+    is_default: bool
+) -> str:
+    client = get_client()
+    result = await client.create_template(
+        name=name,
+        body=body,
+        type=type,
+        is_default=is_default
+    )
+
+    template_data = result.get("data", {})
+    template_id = template_data.get("id", "unknown")
+    return f"Successfully created template '{name}' (ID: {template_id})"
+
+
 @mcp.tool()
 async def create_template(
     name: str,
     body: str,
-    type: str = "campaign",
+    type: TemplateType = "campaign",
     is_default: bool = False
 ) -> str:
     """
@@ -788,20 +954,26 @@ async def create_template(
         type: Template type (campaign, tx)
         is_default: Whether this is the default template
     """
-    async def _create_template_logic() -> str:
-        client = get_client()
-        result = await client.create_template(
-            name=name,
-            body=body,
-            type=type,
-            is_default=is_default
-        )
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _create_template_logic, name, body, type, is_default
+    )
 
-        template_data = result.get("data", {})
-        template_id = template_data.get("id", "unknown")
-        return f"Successfully created template '{name}' (ID: {template_id})"
 
-    return await safe_execute_async(_create_template_logic)  # type: ignore[no-any-return]
+async def _update_template_logic(
+    template_id: int,
+    name: str | None,
+    body: str | None,
+    is_default: bool | None
+) -> str:
+    client = get_client()
+    await client.update_template(
+        template_id=template_id,
+        name=name,
+        body=body,
+        is_default=is_default
+    )
+
+    return f"Successfully updated template {template_id}"
 
 
 @mcp.tool()
@@ -820,18 +992,16 @@ async def update_template(
         body: New template HTML body content
         is_default: Whether this is the default template
     """
-    async def _update_template_logic() -> str:
-        client = get_client()
-        await client.update_template(
-            template_id=template_id,
-            name=name,
-            body=body,
-            is_default=is_default
-        )
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _update_template_logic, template_id, name, body, is_default
+    )
 
-        return f"Successfully updated template {template_id}"
 
-    return await safe_execute_async(_update_template_logic)  # type: ignore[no-any-return]
+async def _delete_template_logic(template_id: int) -> str:
+    client = get_client()
+    await client.delete_template(template_id)
+
+    return f"Successfully deleted template {template_id}"
 
 
 @mcp.tool()
@@ -842,13 +1012,24 @@ async def delete_template(template_id: int) -> str:
     Args:
         template_id: ID of the template to delete
     """
-    async def _delete_template_logic() -> str:
-        client = get_client()
-        await client.delete_template(template_id)
+    return await safe_execute_async(_delete_template_logic, template_id)  # type: ignore[no-any-return]
+
 
-        return f"Successfully deleted template {template_id}"
+async def _send_transactional_logic(
+    template_id: int,
+    subscriber_email: str,
+    data: dict[str, Any] | None,
+    content_type: ContentType
+) -> str:
+    client = get_client()
+    await client.send_transactional_email(
+        template_id=template_id,
+        subscriber_email=subscriber_email,
+        data=data or {},
+        content_type=content_type
+    )
 
-    return await safe_execute_async(_delete_template_logic)  # type: ignore[no-any-return]
+    return f"Successfully sent transactional email to {subscriber_email}"
 
 
 @mcp.tool()
@@ -856,7 +1037,7 @@ async def send_transactional_email(
     template_id: int,
     subscriber_email: str,
     data: dict[str, Any] | None = None,
-    content_type: str = "html"
+    content_type: ContentType = "html"
 ) -> str:
     """
     Send a transactional email using a template.
@@ -867,18 +1048,9 @@ async def send_transactional_email(
         data: Template variables/data
         content_type: Content type (html, plain)
     """
-    async def _send_transactional_logic() -> str:
-        client = get_client()
-        await client.send_transactional_email(
-            template_id=template_id,
-            subscriber_email=subscriber_email,
-            data=data or {},
-            content_type=content_type
-        )
-
-        return f"Successfully sent transactional email to {subscriber_email}"
-
-    return await safe_execute_async(_send_transactional_logic)  # type: ignore[no-any-return]
+    return await safe_execute_async(  # type: ignore[no-any-return]
+        _send_transactional_logic, template_id, subscriber_email, data, content_type
+    )
 
 
 # Template Resources